@@ -1,5 +1,6 @@
 import asyncio
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Dict, List, Optional, Union
 
 from . import util
@@ -11,12 +12,15 @@ from .async_client import AsyncOrthanc
 from .client import Orthanc
 from .util import async_to_sync
 
+DEFAULT_MAX_WORKERS = 16
+
 
 def find(orthanc: Union[Orthanc, AsyncOrthanc],
          patient_filter: Optional[Callable] = None,
          study_filter: Optional[Callable] = None,
          series_filter: Optional[Callable] = None,
-         instance_filter: Optional[Callable] = None) -> List[Patient]:
+         instance_filter: Optional[Callable] = None,
+         max_workers: int = DEFAULT_MAX_WORKERS) -> List[Patient]:
     """Find desired patients/Study/Series/Instance in an Orthanc server
 
     This function builds a series of tree structure.
@@ -25,6 +29,13 @@ def find(orthanc: Union[Orthanc, AsyncOrthanc],
 
     `Patient -> Studies -> Series -> Instances`
 
+    Notes
+    -----
+    With a synchronous client (`Orthanc`), the patient trees are built concurrently
+    in a thread pool. The filters are therefore called from worker threads and
+    must be thread-safe (e.g. not mutate shared state without a lock).
+    Use `max_workers=1` to build the trees one at a time.
+
     Parameters
     ----------
     orthanc
@@ -37,6 +48,9 @@ def find(orthanc: Union[Orthanc, AsyncOrthanc],
         Series filter (e.g. lambda series: series.modality == 'SR')
     instance_filter
         Instance filter (e.g. lambda instance: instance.SOPInstance == '...')
+    max_workers
+        Maximum number of threads used to build the patient trees with a synchronous client.
+        Ignored with an `AsyncOrthanc` client, which relies on asyncio instead.
 
     Returns
     -------
@@ -56,22 +70,41 @@ def find(orthanc: Union[Orthanc, AsyncOrthanc],
         ))
 
     patients = [Patient(i, orthanc, _lock_children=True) for i in orthanc.get_patients()]
+
+    # Patient trees are independent, so they are built concurrently to overlap the HTTP round-trips.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        patients = executor.map(
+            lambda patient: _build_patient(patient, patient_filter, study_filter, series_filter, instance_filter),
+            patients
+        )
+        patients = [p for p in patients if p is not None]
+
+    return trim_patients(patients)
+
+
+def _build_patient(
+        patient: Patient,
+        patient_filter: Optional[Callable],
+        study_filter: Optional[Callable],
+        series_filter: Optional[Callable],
+        instance_filter: Optional[Callable]) -> Optional[Patient]:
     if patient_filter is not None:
-        patients = [i for i in patients if patient_filter(i)]
+        if not patient_filter(patient):
+            return  # Means that the patient did not pass the filter criteria.
 
-    for patient in patients:
-        if study_filter is not None:
-            patient._child_resources = [i for i in patient.studies if study_filter(i)]
+    # Children are prefetched only when filtered, since the filters are likely to read their attributes
+    if study_filter is not None:
+        patient._child_resources = [i for i in patient.get_studies(prefetch=True) if study_filter(i)]
 
-        for study in patient.studies:
-            if series_filter is not None:
-                study._child_resources = [i for i in study.series if series_filter(i)]
+    for study in patient.studies:
+        if series_filter is not None:
+            study._child_resources = [i for i in study.get_series(prefetch=True) if series_filter(i)]
 
-            for series in study.series:
-                if instance_filter is not None:
-                    series._child_resources = [i for i in series.instances if instance_filter(i)]
+        for a_series in study.series:
+            if instance_filter is not None:
+                a_series._child_resources = [i for i in a_series.get_instances(prefetch=True) if instance_filter(i)]
 
-    return trim_patients(patients)
+    return patient
 
 
 async def _async_find(
@@ -81,6 +114,10 @@ async def _async_find(
         series_filter: Optional[Callable] = None,
         instance_filter: Optional[Callable] = None) -> List[Patient]:
     patient_identifiers = await async_orthanc.get_patients()
+
+    # A single synchronous client is shared by all the built resources so that they reuse
+    # the same connection pool, rather than opening a new one for each resource.
+    orthanc = async_to_sync(async_orthanc)
     tasks = []
 
     for patient_id in patient_identifiers:  # This ID is the Orthanc's ID, and not the PatientID
@@ -88,6 +125,7 @@ async def _async_find(
             _async_build_patient(
                 patient_id,
                 async_orthanc,
+                orthanc,
                 patient_filter,
                 study_filter,
                 series_filter,
@@ -105,11 +143,12 @@ async def _async_find(
 async def _async_build_patient(
         patient_id_: str,
         async_orthanc: AsyncOrthanc,
+        orthanc: Orthanc,
         patient_filter: Optional[Callable],
         study_filter: Optional[Callable],
         series_filter: Optional[Callable],
         instance_filter: Optional[Callable]) -> Patient:
-    patient = Patient(patient_id_, async_to_sync(async_orthanc), _lock_children=True)
+    patient = Patient(patient_id_, orthanc, _lock_children=True)
 
     if patient_filter is not None:
         if not patient_filter(patient):
@@ -121,7 +160,7 @@ async def _async_build_patient(
     tasks = []
     for info in study_information:
         task = asyncio.create_task(
-            _async_build_study(info, async_orthanc, study_filter, series_filter, instance_filter)
+            _async_build_study(info, async_orthanc, orthanc, study_filter, series_filter, instance_filter)
         )
         tasks.append(task)
 
@@ -133,11 +172,11 @@ async def _async_build_patient(
 async def _async_build_study(
         study_information: Dict,
         async_orthanc: AsyncOrthanc,
+        orthanc: Orthanc,
         study_filter: Optional[Callable],
         series_filter: Optional[Callable],
         instance_filter: Optional[Callable]) -> Study:
-    study = Study(study_information['ID'], async_to_sync(async_orthanc), _lock_children=True)
-    study._information = study_information
+    study = Study(study_information['ID'], orthanc, _lock_children=True, _information=study_information)
 
     if study_filter is not None:
         if not study_filter(study):
@@ -148,7 +187,7 @@ async def _async_build_study(
 
     tasks = []
     for info in series_information:
-        task = asyncio.create_task(_async_build_series(info, async_orthanc, series_filter, instance_filter))
+        task = asyncio.create_task(_async_build_series(info, async_orthanc, orthanc, series_filter, instance_filter))
         tasks.append(task)
 
     study._child_resources = await asyncio.gather(*tasks)
@@ -159,10 +198,10 @@ async def _async_build_study(
 async def _async_build_series(
         series_information: Dict,
         async_orthanc: AsyncOrthanc,
+        orthanc: Orthanc,
         series_filter: Optional[Callable],
         instance_filter: Optional[Callable]) -> Series:
-    series = Series(series_information['ID'], async_to_sync(async_orthanc), _lock_children=True)
-    series._information = series_information
+    series = Series(series_information['ID'], orthanc, _lock_children=True, _information=series_information)
 
     if series_filter is not None:
         if not series_filter(series):
@@ -171,7 +210,7 @@ async def _async_build_series(
 
     instance_information = await async_orthanc.get_series_id_instances(series_information['ID'])
     series._child_resources = [
-        _build_instance(i, async_to_sync(async_orthanc), instance_filter) for i in instance_information
+        _build_instance(i, orthanc, instance_filter) for i in instance_information
     ]
 
     return series
@@ -181,8 +220,7 @@ def _build_instance(
         instance_information: Dict,
         orthanc: Orthanc,
         instance_filter: Optional[Callable]) -> Optional[Instance]:
-    instance = Instance(instance_information['ID'], orthanc, _lock_children=True)
-    instance._information = instance_information
+    instance = Instance(instance_information['ID'], orthanc, _lock_children=True, _information=instance_information)
 
     if instance_filter is not None:
         if not instance_filter(instance):
@@ -207,6 +245,6 @@ def trim_patients(patients: List[Patient]) -> List[Patient]:
     for patient in patients:
         patient.remove_empty_studies()
 
-    patients = [p for p in patients if p.studies != []]
+    patients = [p for p in patients if p.studies]
 
     return patients
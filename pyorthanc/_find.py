@@ -276,17 +276,18 @@ def query_orthanc(client: Orthanc,
         results = client.post_tools_find(data)
 
     if level == 'Patient':
-        resources = [Patient(i['ID'], client, _lock_children=lock_children) for i in results]
+        resource_type = Patient
     elif level == 'Study':
-        resources = [Study(i['ID'], client, _lock_children=lock_children) for i in results]
+        resource_type = Study
     elif level == 'Series':
-        resources = [Series(i['ID'], client, _lock_children=lock_children) for i in results]
+        resource_type = Series
     elif level == 'Instance':
-        resources = [Instance(i['ID'], client, _lock_children=lock_children) for i in results]
+        resource_type = Instance
     else:
         raise ValueError(f"Unknown level ['Patient', 'Study', 'Series', 'Instance'], got {level}")
 
-    return resources
+    # The query is expanded, so the main information is already known and can be cached
+    return [resource_type(i['ID'], client, _lock_children=lock_children, _information=i) for i in results]
 
 
 def _validate_labels_constraint(labels_constraint: str) -> None:
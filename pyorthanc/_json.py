@@ -0,0 +1,9 @@
+# JSON decoder used by the Orthanc clients.
+# orjson is an optional dependency (`pip install pyorthanc[performance]`) that is much faster
+# than the standard library on large responses (e.g. expanded /tools/find results).
+try:
+    from orjson import loads
+except ModuleNotFoundError:
+    from json import loads
+
+__all__ = ['loads']
@@ -19,6 +19,8 @@ class Instance(Resource):
     or the entire DICOM file of the Instance
     """
 
+    __slots__ = ()
+
     def get_dicom_file_content(self) -> bytes:
         """Retrieves DICOM file
 
@@ -99,7 +101,7 @@ class Instance(Resource):
         int
             The file size in bytes.
         """
-        return self.get_main_information()['FileSize']
+        return self._get_cached_main_information()['FileSize']
 
     @property
     def creation_date(self) -> datetime:
@@ -120,7 +122,7 @@ class Instance(Resource):
     @property
     def series_identifier(self) -> str:
         """Get the parent series identifier"""
-        return self.get_main_information()['ParentSeries']
+        return self._get_cached_main_information()['ParentSeries']
 
     @property
     def parent_series(self) -> Series:
@@ -147,13 +149,13 @@ class Instance(Resource):
     def image_orientation_patient(self) -> List[float]:
         orientation = self._get_main_dicom_tag_value('ImageOrientationPatient')
 
-        return [float(i) for i in orientation.split('\\')]
+        return list(map(float, orientation.split('\\')))
 
     @property
     def image_position_patient(self) -> List[float]:
         position = self._get_main_dicom_tag_value('ImagePositionPatient')
 
-        return [float(i) for i in position.split('\\')]
+        return list(map(float, position.split('\\')))
 
     @property
     def image_comments(self) -> str:
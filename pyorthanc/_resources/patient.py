@@ -1,6 +1,6 @@
 import warnings
 from datetime import datetime
-from typing import BinaryIO, Dict, List, Union
+from typing import BinaryIO, Dict, Iterator, List, Optional, Union
 
 from httpx import ReadTimeout
 
@@ -17,6 +17,8 @@ class Patient(Resource):
     or the entire DICOM file of the Patient
     """
 
+    __slots__ = ()
+
     def get_main_information(self) -> Dict:
         """Get Patient information
 
@@ -59,9 +61,7 @@ class Patient(Resource):
 
     @property
     def last_update(self) -> datetime:
-        last_updated_date_and_time = self.get_main_information()['LastUpdate'].split('T')
-        date = last_updated_date_and_time[0]
-        time = last_updated_date_and_time[1]
+        date, _, time = self.get_main_information()['LastUpdate'].partition('T')
 
         return util.make_datetime_from_dicom_date(date, time)
 
@@ -100,6 +100,36 @@ class Patient(Resource):
         """
         return self.client.get_patients_id_archive(self.id_)
 
+    def get_zip_stream(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """Stream the bytes of the zip file
+
+        This method is an alternative to the `.get_zip()` method for large files.
+        The zip file is yielded in chunks while being downloaded, so it never needs
+        to be held entirely in memory.
+
+        Parameters
+        ----------
+        chunk_size
+            Size (in bytes) of the yielded chunks. If None, chunks are yielded as they are received.
+
+        Returns
+        -------
+        Iterator[bytes]
+            Chunks of the zip file of the patient.
+
+        Examples
+        --------
+        ```python
+        from pyorthanc import Orthanc, Patient
+        a_patient = Patient('A_PATIENT_IDENTIFIER', Orthanc('http://localhost:8042'))
+
+        with open('patient_zip_file_path.zip', 'wb') as file_handler:
+            for chunk in a_patient.get_zip_stream(chunk_size=1024 * 1024):
+                file_handler.write(chunk)
+        ```
+        """
+        return self._stream_file(f'{self.client.url}/patients/{self.id_}/archive', chunk_size)
+
     def download(self, filepath: Union[str, BinaryIO], with_progres: bool = False) -> None:
         """Download the zip file to a target path or buffer
 
@@ -186,9 +216,11 @@ class Patient(Resource):
         bool
             False means unprotected, True means protected.
         """
-        DeprecationWarning(
+        warnings.warn(
             '`patient.is_protected()` is deprecated and will be removed in future release. '
-            'Use `patient.protected` instead.'
+            'Use `patient.protected` instead.',
+            DeprecationWarning,
+            stacklevel=2
         )
         return self.protected
 
@@ -233,16 +265,39 @@ class Patient(Resource):
         List[Study]
             List of the patient's studies
         """
-        if self._lock_children:
-            if self._child_resources is None:
-                studies_ids = self.get_main_information()['Studies']
-                self._child_resources = [Study(i, self.client, self._lock_children) for i in studies_ids]
+        return self.get_studies()
 
-            return self._child_resources
+    def get_studies(self, prefetch: bool = False) -> List[Study]:
+        """Get patient's studies
 
-        studies_ids = self.get_main_information()['Studies']
+        Parameters
+        ----------
+        prefetch
+            If True, the main information of all the studies is retrieved in a single
+            query and cached in the returned studies. Favor this option when the
+            attributes of many studies are accessed afterward.
 
-        return [Study(i, self.client) for i in studies_ids]
+        Returns
+        -------
+        List[Study]
+            List of the patient's studies
+        """
+        return self._get_child_resources(self._make_studies, prefetch)
+
+    def _make_studies(self, prefetch: bool) -> List[Study]:
+        if prefetch:
+            return [
+                Study(i['ID'], self.client, self._lock_children, _information=i)
+                for i in self.client.get_patients_id_studies(self.id_)
+            ]
+
+        # Unlocked resources list their children at every access since they may change (e.g. during ingestion)
+        if self._lock_children and self._information is not None:
+            studies_ids = self._information['Studies']
+        else:
+            studies_ids = self.client.get_patients_id_studies(self.id_, params={'expand': False})
+
+        return [Study(i, self.client, self._lock_children) for i in studies_ids]
 
     def anonymize(self, remove: List = None, replace: Dict = None, keep: List = None,
                   force: bool = False, keep_private_tags: bool = False,
@@ -300,25 +355,19 @@ class Patient(Resource):
         )
         ```
         """
-        remove = [] if remove is None else remove
-        replace = {} if replace is None else replace
-        keep = [] if keep is None else keep
-
-        data = {
-            'Asynchronous': False,
-            'Remove': remove,
-            'Replace': replace,
-            'Keep': keep,
-            'Force': force,
-            'KeepPrivateTags': keep_private_tags,
-            'KeepSource': keep_source,
-            'Priority': priority,
-            'Permissive': permissive,
-        }
-        if private_creator is not None:
-            data['PrivateCreator'] = private_creator
-        if dicom_version is not None:
-            data['DicomVersion'] = dicom_version
+        data = self._make_anonymization_data(
+            asynchronous=False,
+            remove=remove,
+            replace=replace,
+            keep=keep,
+            force=force,
+            keep_private_tags=keep_private_tags,
+            keep_source=keep_source,
+            priority=priority,
+            permissive=permissive,
+            private_creator=private_creator,
+            dicom_version=dicom_version
+        )
 
         try:
             anonymous_patient = self.client.post_patients_id_anonymize(self.id_, data)
@@ -386,25 +435,19 @@ class Patient(Resource):
         new_patient = Patient(job.content['ID'], orthanc)
         ```
         """
-        remove = [] if remove is None else remove
-        replace = {} if replace is None else replace
-        keep = [] if keep is None else keep
-
-        data = {
-            'Asynchronous': True,
-            'Remove': remove,
-            'Replace': replace,
-            'Keep': keep,
-            'Force': force,
-            'KeepPrivateTags': keep_private_tags,
-            'KeepSource': keep_source,
-            'Priority': priority,
-            'Permissive': permissive,
-        }
-        if private_creator is not None:
-            data['PrivateCreator'] = private_creator
-        if dicom_version is not None:
-            data['DicomVersion'] = dicom_version
+        data = self._make_anonymization_data(
+            asynchronous=True,
+            remove=remove,
+            replace=replace,
+            keep=keep,
+            force=force,
+            keep_private_tags=keep_private_tags,
+            keep_source=keep_source,
+            priority=priority,
+            permissive=permissive,
+            private_creator=private_creator,
+            dicom_version=dicom_version
+        )
 
         job_info = self.client.post_patients_id_anonymize(self.id_, data)
 
@@ -495,7 +538,7 @@ class Patient(Resource):
             )
 
         # Reset cache since a main DICOM tag may have be changed
-        self._main_dicom_tags = None
+        self._invalidate()
 
         # if 'PatientID' is not affected, the modified_patient['ID'] is the same as self.id_
         return Patient(modified_patient['ID'], self.client)
@@ -590,7 +633,7 @@ class Patient(Resource):
         job_info = self.client.post_patients_id_modify(self.id_, data)
 
         # Reset cache since a main DICOM tag may have be changed
-        self._main_dicom_tags = None
+        self._invalidate()
 
         return Job(job_info['ID'], self.client)
 
@@ -612,7 +655,12 @@ class Patient(Resource):
         if self._child_resources is None:
             return
 
+        studies = []
         for study in self._child_resources:
             study.remove_empty_series()
 
-        self._child_resources = [study for study in self._child_resources if study._child_resources != []]
+            # Children that were never retrieved (None) are unknown rather than empty
+            if study._child_resources is None or study._child_resources:
+                studies.append(study)
+
+        self._child_resources = studies
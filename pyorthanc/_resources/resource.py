@@ -1,6 +1,7 @@
 import abc
-from typing import Any, BinaryIO, Dict, List, Optional, Union
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Union
 
+import httpx
 from httpx._types import QueryParamTypes
 
 from .. import errors, util
@@ -8,8 +9,10 @@ from ..client import Orthanc
 
 
 class Resource:
+    __slots__ = ('id_', 'client', '_lock_children', '_information', '_tag_cache', '_child_resources')
 
-    def __init__(self, id_: str, client: Orthanc, _lock_children: bool = False) -> None:
+    def __init__(self, id_: str, client: Orthanc, _lock_children: bool = False,
+                 _information: Optional[Dict] = None) -> None:
         """Constructor
 
         Parameters
@@ -22,6 +25,10 @@ class Resource:
             If `_lock_children` is True, the resource children (ex. instances of a series via `Series.instances`)
             will be cached at the first query rather than queried every time. This is useful when you want
             to filter the children of a resource and want to maintain the filter result.
+        _information
+            Main information of the resource, if already known (e.g. from an expanded query).
+            It is cached, and its main DICOM tags are flattened into the tag cache
+            so that tag properties are served without any query.
         """
         client = util.ensure_non_raw_response(client)
 
@@ -29,7 +36,8 @@ class Resource:
         self.client = client
 
         self._lock_children = _lock_children
-        self._main_dicom_tags: Optional[Dict] = None
+        self._information = _information
+        self._tag_cache: Dict[str, Any] = {} if _information is None else dict(_information.get('MainDicomTags', {}))
         self._child_resources: Optional[List['Resource']] = None
 
     @property
@@ -45,21 +53,103 @@ class Resource:
 
     @property
     def main_dicom_tags(self) -> Dict[str, str]:
-        if self._main_dicom_tags is None:
-            self._main_dicom_tags = self.get_main_information()['MainDicomTags']
-
-        return self._main_dicom_tags
+        return self._get_cached_main_information()['MainDicomTags']
 
     @abc.abstractmethod
     def get_main_information(self):
         raise NotImplementedError
 
+    def refresh(self) -> None:
+        """Clear the cached main information
+
+        The main information of the resource (main DICOM tags, parent identifiers, etc.)
+        is queried once and then served from a cache. Call this method to query it
+        again from Orthanc at the next access. Fields that change over time
+        (labels, stability, last update) are always queried.
+        """
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Reset the cached main information and tag values after the resource has been changed"""
+        self._information = None
+        self._tag_cache.clear()
+
+    def _get_cached_main_information(self) -> Dict:
+        if self._information is None:
+            self._information = self.get_main_information()
+
+        return self._information
+
+    def _get_child_resources(
+            self, make_child_resources: Callable[[bool], List['Resource']],
+            prefetch: bool = False) -> List['Resource']:
+        if not self._lock_children:
+            return make_child_resources(prefetch)
+
+        if self._child_resources is None:
+            self._child_resources = make_child_resources(prefetch)
+
+        elif prefetch and any(c is not None and c._information is None for c in self._child_resources):
+            # The cached children may have been filtered, so they are hydrated rather than replaced
+            prefetched_children = {c.id_: c for c in make_child_resources(prefetch)}
+
+            for child in self._child_resources:
+                if child is not None and child._information is None and child.id_ in prefetched_children:
+                    child._set_information(prefetched_children[child.id_]._information)
+
+        return self._child_resources
+
+    def _set_information(self, information: Dict) -> None:
+        self._information = information
+        self._tag_cache.update(information.get('MainDicomTags', {}))
+
     def _get_main_dicom_tag_value(self, tag: str) -> Any:
+        # Tag values are cached apart from the main information so that a resource
+        # built from known information (see `_information`) serves them directly.
         try:
-            return self.main_dicom_tags[tag]
+            return self._tag_cache[tag]
+        except KeyError:
+            pass
+
+        try:
+            value = self.main_dicom_tags[tag]
         except KeyError:
             raise errors.TagDoesNotExistError(f'{self} has no {tag} tag.')
 
+        self._tag_cache[tag] = value
+
+        return value
+
+    def _make_anonymization_data(
+            self, asynchronous: bool,
+            remove: Optional[List] = None,
+            replace: Optional[Dict] = None,
+            keep: Optional[List] = None,
+            force: bool = False,
+            keep_private_tags: bool = False,
+            keep_source: bool = True,
+            priority: int = 0,
+            permissive: bool = False,
+            private_creator: Optional[str] = None,
+            dicom_version: Optional[str] = None) -> Dict:
+        data = {
+            'Asynchronous': asynchronous,
+            'Remove': [] if remove is None else remove,
+            'Replace': {} if replace is None else replace,
+            'Keep': [] if keep is None else keep,
+            'Force': force,
+            'KeepPrivateTags': keep_private_tags,
+            'KeepSource': keep_source,
+            'Priority': priority,
+            'Permissive': permissive,
+        }
+        if private_creator is not None:
+            data['PrivateCreator'] = private_creator
+        if dicom_version is not None:
+            data['DicomVersion'] = dicom_version
+
+        return data
+
     def _make_response_format_params(self, simplify: bool = False, short: bool = False) -> Dict:
         if simplify and not short:
             params = {'simplify': True}
@@ -72,6 +162,18 @@ class Resource:
 
         return params
 
+    def _stream_file(
+            self, url: str,
+            chunk_size: Optional[int] = None,
+            params: Optional[QueryParamTypes] = None) -> Iterator[bytes]:
+        with self.client.stream('GET', url, params=params) as response:
+            if not 200 <= response.status_code < 300:
+                response.read()
+                raise httpx.HTTPError(f'HTTP code: {response.status_code}, with content: {response.text}')
+
+            for chunk in response.iter_bytes(chunk_size):
+                yield chunk
+
     def _download_file(
             self, url: str,
             filepath: Union[str, BinaryIO],
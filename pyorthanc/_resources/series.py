@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import BinaryIO, Dict, List, TYPE_CHECKING, Union
+from typing import BinaryIO, Dict, Iterator, List, Optional, TYPE_CHECKING, Union
 
 from httpx import ReadTimeout
 
@@ -21,19 +21,44 @@ class Series(Resource):
     or the entire DICOM file of the Series
     """
 
+    __slots__ = ()
+
     @property
     def instances(self) -> List[Instance]:
         """Get series instance"""
-        if self._lock_children:
-            if self._child_resources is None:
-                instances_ids = self.get_main_information()['Instances']
-                self._child_resources = [Instance(i, self.client, self._lock_children) for i in instances_ids]
+        return self.get_instances()
+
+    def get_instances(self, prefetch: bool = False) -> List[Instance]:
+        """Get series instances
+
+        Parameters
+        ----------
+        prefetch
+            If True, the main information of all the instances is retrieved in a single
+            query and cached in the returned instances. Favor this option when the
+            attributes of many instances are accessed afterward.
+
+        Returns
+        -------
+        List[Instance]
+            List of the series' instances
+        """
+        return self._get_child_resources(self._make_instances, prefetch)
 
-            return self._child_resources
+    def _make_instances(self, prefetch: bool) -> List[Instance]:
+        if prefetch:
+            return [
+                Instance(i['ID'], self.client, self._lock_children, _information=i)
+                for i in self.client.get_series_id_instances(self.id_)
+            ]
 
-        instances_ids = self.get_main_information()['Instances']
+        # Unlocked resources list their children at every access since they may change (e.g. during ingestion)
+        if self._lock_children and self._information is not None:
+            instances_ids = self._information['Instances']
+        else:
+            instances_ids = self.client.get_series_id_instances(self.id_, params={'expand': False})
 
-        return [Instance(i, self.client) for i in instances_ids]
+        return [Instance(i, self.client, self._lock_children) for i in instances_ids]
 
     @property
     def uid(self) -> str:
@@ -58,7 +83,7 @@ class Series(Resource):
     @property
     def study_identifier(self) -> str:
         """Get the parent study identifier"""
-        return self.get_main_information()['ParentStudy']
+        return self._get_cached_main_information()['ParentStudy']
 
     @property
     def parent_study(self) -> Study:
@@ -145,7 +170,7 @@ class Series(Resource):
     def image_orientation_patient(self) -> List[float]:
         orientation = self._get_main_dicom_tag_value('ImageOrientationPatient')
 
-        return [float(i) for i in orientation.split('\\')]
+        return list(map(float, orientation.split('\\')))
 
     @property
     def series_type(self) -> str:
@@ -169,9 +194,7 @@ class Series(Resource):
 
     @property
     def last_update(self) -> datetime:
-        last_updated_date_and_time = self.get_main_information()['LastUpdate'].split('T')
-        date = last_updated_date_and_time[0]
-        time = last_updated_date_and_time[1]
+        date, _, time = self.get_main_information()['LastUpdate'].partition('T')
 
         return util.make_datetime_from_dicom_date(date, time)
 
@@ -238,25 +261,19 @@ class Series(Resource):
             replace={'SeriesDescription': 'A description'}
         )
         """
-        remove = [] if remove is None else remove
-        replace = {} if replace is None else replace
-        keep = [] if keep is None else keep
-
-        data = {
-            'Asynchronous': False,
-            'Remove': remove,
-            'Replace': replace,
-            'Keep': keep,
-            'Force': force,
-            'KeepPrivateTags': keep_private_tags,
-            'KeepSource': keep_source,
-            'Priority': priority,
-            'Permissive': permissive,
-        }
-        if private_creator is not None:
-            data['PrivateCreator'] = private_creator
-        if dicom_version is not None:
-            data['DicomVersion'] = dicom_version
+        data = self._make_anonymization_data(
+            asynchronous=False,
+            remove=remove,
+            replace=replace,
+            keep=keep,
+            force=force,
+            keep_private_tags=keep_private_tags,
+            keep_source=keep_source,
+            priority=priority,
+            permissive=permissive,
+            private_creator=private_creator,
+            dicom_version=dicom_version
+        )
 
         try:
             anonymous_series = self.client.post_series_id_anonymize(self.id_, data)
@@ -324,25 +341,19 @@ class Series(Resource):
         new_series = Series(job.content['ID'], orthanc)
         ```
         """
-        remove = [] if remove is None else remove
-        replace = {} if replace is None else replace
-        keep = [] if keep is None else keep
-
-        data = {
-            'Asynchronous': True,
-            'Remove': remove,
-            'Replace': replace,
-            'Keep': keep,
-            'Force': force,
-            'KeepPrivateTags': keep_private_tags,
-            'KeepSource': keep_source,
-            'Priority': priority,
-            'Permissive': permissive,
-        }
-        if private_creator is not None:
-            data['PrivateCreator'] = private_creator
-        if dicom_version is not None:
-            data['DicomVersion'] = dicom_version
+        data = self._make_anonymization_data(
+            asynchronous=True,
+            remove=remove,
+            replace=replace,
+            keep=keep,
+            force=force,
+            keep_private_tags=keep_private_tags,
+            keep_source=keep_source,
+            priority=priority,
+            permissive=permissive,
+            private_creator=private_creator,
+            dicom_version=dicom_version
+        )
 
         job_info = self.client.post_series_id_anonymize(self.id_, data)
 
@@ -435,7 +446,7 @@ class Series(Resource):
             )
 
         # Reset cache since a main DICOM tag may have be changed
-        self._main_dicom_tags = None
+        self._invalidate()
 
         # if 'SeriesInstanceUID' is not affected, the modified_series['ID'] is the same as self.id_
         return Series(modified_series['ID'], self.client)
@@ -545,7 +556,7 @@ class Series(Resource):
         job_info = self.client.post_series_id_modify(self.id_, data)
 
         # Reset cache since a main DICOM tag may have be changed
-        self._main_dicom_tags = None
+        self._invalidate()
 
         return Job(job_info['ID'], self.client)
 
@@ -573,6 +584,36 @@ class Series(Resource):
         """
         return self.client.get_series_id_archive(self.id_)
 
+    def get_zip_stream(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """Stream the bytes of the zip file
+
+        This method is an alternative to the `.get_zip()` method for large files.
+        The zip file is yielded in chunks while being downloaded, so it never needs
+        to be held entirely in memory.
+
+        Parameters
+        ----------
+        chunk_size
+            Size (in bytes) of the yielded chunks. If None, chunks are yielded as they are received.
+
+        Returns
+        -------
+        Iterator[bytes]
+            Chunks of the zip file of the series.
+
+        Examples
+        --------
+        ```python
+        from pyorthanc import Orthanc, Series
+        a_series = Series('A_SERIES_IDENTIFIER', Orthanc('http://localhost:8042'))
+
+        with open('series_zip_file_path.zip', 'wb') as file_handler:
+            for chunk in a_series.get_zip_stream(chunk_size=1024 * 1024):
+                file_handler.write(chunk)
+        ```
+        """
+        return self._stream_file(f'{self.client.url}/series/{self.id_}/archive', chunk_size)
+
     def download(self, filepath: Union[str, BinaryIO], with_progres: bool = False) -> None:
         """Download the zip file to a target path or buffer
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import BinaryIO, Dict, List, TYPE_CHECKING, Union
+from typing import BinaryIO, Dict, Iterator, List, Optional, TYPE_CHECKING, Union
 
 from httpx import ReadTimeout
 
@@ -21,6 +21,8 @@ class Study(Resource):
     or the entire DICOM file of the Series
     """
 
+    __slots__ = ()
+
     def get_main_information(self) -> Dict:
         """Get Study information
 
@@ -73,7 +75,7 @@ class Study(Resource):
     @property
     def patient_identifier(self) -> str:
         """Get the Orthanc identifier of the parent patient"""
-        return self.get_main_information()['ParentPatient']
+        return self._get_cached_main_information()['ParentPatient']
 
     @property
     def parent_patient(self) -> Patient:
@@ -83,21 +85,44 @@ class Study(Resource):
     @property
     def patient_information(self) -> Dict:
         """Get patient information"""
-        return self.get_main_information()['PatientMainDicomTags']
+        return self._get_cached_main_information()['PatientMainDicomTags']
 
     @property
     def series(self) -> List[Series]:
         """Get Study series"""
-        if self._lock_children:
-            if self._child_resources is None:
-                series_ids = self.get_main_information()['Series']
-                self._child_resources = [Series(i, self.client, self._lock_children) for i in series_ids]
+        return self.get_series()
+
+    def get_series(self, prefetch: bool = False) -> List[Series]:
+        """Get Study series
+
+        Parameters
+        ----------
+        prefetch
+            If True, the main information of all the series is retrieved in a single
+            query and cached in the returned series. Favor this option when the
+            attributes of many series are accessed afterward.
+
+        Returns
+        -------
+        List[Series]
+            List of the study's series
+        """
+        return self._get_child_resources(self._make_series, prefetch)
 
-            return self._child_resources
+    def _make_series(self, prefetch: bool) -> List[Series]:
+        if prefetch:
+            return [
+                Series(i['ID'], self.client, self._lock_children, _information=i)
+                for i in self.client.get_studies_id_series(self.id_)
+            ]
 
-        series_ids = self.get_main_information()['Series']
+        # Unlocked resources list their children at every access since they may change (e.g. during ingestion)
+        if self._lock_children and self._information is not None:
+            series_ids = self._information['Series']
+        else:
+            series_ids = self.client.get_studies_id_series(self.id_, params={'expand': False})
 
-        return [Series(i, self.client) for i in series_ids]
+        return [Series(i, self.client, self._lock_children) for i in series_ids]
 
     @property
     def accession_number(self) -> str:
@@ -121,9 +146,7 @@ class Study(Resource):
 
     @property
     def last_update(self) -> datetime:
-        last_updated_date_and_time = self.get_main_information()['LastUpdate'].split('T')
-        date = last_updated_date_and_time[0]
-        time = last_updated_date_and_time[1]
+        date, _, time = self.get_main_information()['LastUpdate'].partition('T')
 
         return util.make_datetime_from_dicom_date(date, time)
 
@@ -190,25 +213,19 @@ class Study(Resource):
             replace={'StudyDescription': 'A description'}
         )
         """
-        remove = [] if remove is None else remove
-        replace = {} if replace is None else replace
-        keep = [] if keep is None else keep
-
-        data = {
-            'Asynchronous': False,
-            'Remove': remove,
-            'Replace': replace,
-            'Keep': keep,
-            'Force': force,
-            'KeepPrivateTags': keep_private_tags,
-            'KeepSource': keep_source,
-            'Priority': priority,
-            'Permissive': permissive,
-        }
-        if private_creator is not None:
-            data['PrivateCreator'] = private_creator
-        if dicom_version is not None:
-            data['DicomVersion'] = dicom_version
+        data = self._make_anonymization_data(
+            asynchronous=False,
+            remove=remove,
+            replace=replace,
+            keep=keep,
+            force=force,
+            keep_private_tags=keep_private_tags,
+            keep_source=keep_source,
+            priority=priority,
+            permissive=permissive,
+            private_creator=private_creator,
+            dicom_version=dicom_version
+        )
 
         try:
             anonymous_study = self.client.post_studies_id_anonymize(self.id_, data)
@@ -276,25 +293,19 @@ class Study(Resource):
         new_study = Study(job.content['ID'], orthanc)
         ```
         """
-        remove = [] if remove is None else remove
-        replace = {} if replace is None else replace
-        keep = [] if keep is None else keep
-
-        data = {
-            'Asynchronous': True,
-            'Remove': remove,
-            'Replace': replace,
-            'Keep': keep,
-            'Force': force,
-            'KeepPrivateTags': keep_private_tags,
-            'KeepSource': keep_source,
-            'Priority': priority,
-            'Permissive': permissive,
-        }
-        if private_creator is not None:
-            data['PrivateCreator'] = private_creator
-        if dicom_version is not None:
-            data['DicomVersion'] = dicom_version
+        data = self._make_anonymization_data(
+            asynchronous=True,
+            remove=remove,
+            replace=replace,
+            keep=keep,
+            force=force,
+            keep_private_tags=keep_private_tags,
+            keep_source=keep_source,
+            priority=priority,
+            permissive=permissive,
+            private_creator=private_creator,
+            dicom_version=dicom_version
+        )
 
         job_info = self.client.post_studies_id_anonymize(self.id_, data)
 
@@ -387,7 +398,7 @@ class Study(Resource):
             )
 
         # Reset cache since a main DICOM tag may have be changed
-        self._main_dicom_tags = None
+        self._invalidate()
 
         # if 'StudyInstanceUID' is not affected, the modified_study['ID'] is the same as self.id_
         return Study(modified_study['ID'], self.client)
@@ -497,7 +508,7 @@ class Study(Resource):
         job_info = self.client.post_studies_id_modify(self.id_, data)
 
         # Reset cache since a main DICOM tag may have be changed
-        self._main_dicom_tags = None
+        self._invalidate()
 
         return Job(job_info['ID'], self.client)
 
@@ -524,6 +535,36 @@ class Study(Resource):
         """
         return self.client.get_studies_id_archive(self.id_)
 
+    def get_zip_stream(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """Stream the bytes of the zip file
+
+        This method is an alternative to the `.get_zip()` method for large files.
+        The zip file is yielded in chunks while being downloaded, so it never needs
+        to be held entirely in memory.
+
+        Parameters
+        ----------
+        chunk_size
+            Size (in bytes) of the yielded chunks. If None, chunks are yielded as they are received.
+
+        Returns
+        -------
+        Iterator[bytes]
+            Chunks of the zip file of the study.
+
+        Examples
+        --------
+        ```python
+        from pyorthanc import Orthanc, Study
+        a_study = Study('A_STUDY_IDENTIFIER', Orthanc('http://localhost:8042'))
+
+        with open('study_zip_file_path.zip', 'wb') as file_handler:
+            for chunk in a_study.get_zip_stream(chunk_size=1024 * 1024):
+                file_handler.write(chunk)
+        ```
+        """
+        return self._stream_file(f'{self.client.url}/studies/{self.id_}/archive', chunk_size)
+
     def download(self, filepath: Union[str, BinaryIO], with_progres: bool = False) -> None:
         """Download the zip file to a target path or buffer
 
@@ -572,7 +613,12 @@ class Study(Resource):
         if self._child_resources is None:
             return
 
-        for series in self._child_resources:
-            series.remove_empty_instances()
+        series = []
+        for a_series in self._child_resources:
+            a_series.remove_empty_instances()
+
+            # Children that were never retrieved (None) are unknown rather than empty
+            if a_series._child_resources is None or a_series._child_resources:
+                series.append(a_series)
 
-        self._child_resources = [series for series in self._child_resources if series._child_resources != []]
+        self._child_resources = series
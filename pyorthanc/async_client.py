@@ -11,6 +11,8 @@ from httpx._types import (
     RequestFiles,
 )
 
+from ._json import loads as _json_loads
+
 
 class AsyncOrthanc(httpx.AsyncClient):
     """Orthanc API
@@ -88,7 +90,7 @@ class AsyncOrthanc(httpx.AsyncClient):
 
         if 200 <= response.status_code < 300:
             if "application/json" in response.headers["content-type"]:
-                return response.json()
+                return _json_loads(response.content)
             elif "text/plain" in response.headers["content-type"]:
                 return response.text
             else:
@@ -131,7 +133,7 @@ class AsyncOrthanc(httpx.AsyncClient):
 
         if 200 <= response.status_code < 300:
             if "application/json" in response.headers["content-type"]:
-                return response.json()
+                return _json_loads(response.content)
             elif "text/plain" in response.headers["content-type"]:
                 return response.text
             else:
@@ -188,7 +190,7 @@ class AsyncOrthanc(httpx.AsyncClient):
 
         if 200 <= response.status_code < 300:
             if "application/json" in response.headers["content-type"]:
-                return response.json()
+                return _json_loads(response.content)
             elif "text/plain" in response.headers["content-type"]:
                 return response.text
             else:
@@ -245,7 +247,7 @@ class AsyncOrthanc(httpx.AsyncClient):
 
         if 200 <= response.status_code < 300:
             if "application/json" in response.headers["content-type"]:
-                return response.json()
+                return _json_loads(response.content)
             elif "text/plain" in response.headers["content-type"]:
                 return response.text
             else:
@@ -11,6 +11,8 @@ from httpx._types import (
     RequestFiles,
 )
 
+from ._json import loads as _json_loads
+
 
 class Orthanc(httpx.Client):
     """Orthanc API
@@ -86,7 +88,7 @@ class Orthanc(httpx.Client):
 
         if 200 <= response.status_code < 300:
             if "application/json" in response.headers["content-type"]:
-                return response.json()
+                return _json_loads(response.content)
             elif "text/plain" in response.headers["content-type"]:
                 return response.text
             else:
@@ -127,7 +129,7 @@ class Orthanc(httpx.Client):
 
         if 200 <= response.status_code < 300:
             if "application/json" in response.headers["content-type"]:
-                return response.json()
+                return _json_loads(response.content)
             elif "text/plain" in response.headers["content-type"]:
                 return response.text
             else:
@@ -184,7 +186,7 @@ class Orthanc(httpx.Client):
 
         if 200 <= response.status_code < 300:
             if "application/json" in response.headers["content-type"]:
-                return response.json()
+                return _json_loads(response.content)
             elif "text/plain" in response.headers["content-type"]:
                 return response.text
             else:
@@ -241,7 +243,7 @@ class Orthanc(httpx.Client):
 
         if 200 <= response.status_code < 300:
             if "application/json" in response.headers["content-type"]:
-                return response.json()
+                return _json_loads(response.content)
             elif "text/plain" in response.headers["content-type"]:
                 return response.text
             else:
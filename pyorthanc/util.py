@@ -1,4 +1,5 @@
 import copy
+import functools
 import hashlib
 import re
 import warnings
@@ -22,8 +23,12 @@ async def async_delete_queries(client: AsyncOrthanc) -> None:
         await client.delete_queries_id(query_id)
 
 
+@functools.lru_cache(maxsize=4096)
 def make_datetime_from_dicom_date(date: str, time: str = None) -> Optional[datetime]:
-    """Attempt to decode date"""
+    """Attempt to decode date
+
+    Results are memoized since many resources share the same dates (e.g. series of a study).
+    """
     try:
         return datetime(
             year=int(date[:4]),
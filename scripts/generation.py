@@ -9,6 +9,7 @@ def generate_client(path: str, async_mode: bool = False):
     document = simple_openapi_client.parse_openapi(ORTHANC_API_URL)
     document = _apply_corrections_to_documents(document)
     client_str = simple_openapi_client.make_client(document, config, async_mode=async_mode, use_black=True)
+    client_str = _use_pyorthanc_json_decoder(client_str)
 
     with open(path, 'w') as file:
         file.write(client_str)
@@ -39,6 +40,17 @@ def _apply_corrections_to_documents(document):
     return document
 
 
+def _use_pyorthanc_json_decoder(client_str: str) -> str:
+    """Decode JSON responses with pyorthanc's decoder (orjson when available)"""
+    client_str = client_str.replace('return response.json()', 'return _json_loads(response.content)')
+
+    return client_str.replace(
+        '    RequestFiles,\n)\n',
+        '    RequestFiles,\n)\n\nfrom ._json import loads as _json_loads\n',
+        1
+    )
+
+
 if __name__ == '__main__':
     generate_client('./pyorthanc/client.py', async_mode=False)
     generate_client('./pyorthanc/async_client.py', async_mode=True)
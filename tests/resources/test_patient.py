@@ -34,6 +34,25 @@ def test_attributes(patient):
     assert [s.identifier for s in patient.studies] == a_patient.INFORMATION['Studies']
 
 
+def test_get_studies_with_prefetch(patient):
+    studies = patient.get_studies(prefetch=True)
+
+    assert [s.identifier for s in studies] == a_patient.INFORMATION['Studies']
+    for study in studies:
+        assert study._information is not None
+        assert study.main_dicom_tags == study.get_main_information()['MainDicomTags']
+
+
+def test_get_studies_with_prefetch_after_locked_children(patient):
+    patient._lock_children = True
+    studies = patient.studies
+    assert all(s._information is None for s in studies)
+
+    # Already cached children are hydrated rather than returned as is
+    assert patient.get_studies(prefetch=True) == studies
+    assert all(s._information is not None for s in studies)
+
+
 def test_zip(patient):
     result = patient.get_zip()
 
@@ -42,6 +61,27 @@ def test_zip(patient):
     assert zipfile.testzip() is None  # Verify that zip files are valid (if it is, returns None)
 
 
+def test_studies_identifiers(patient):
+    expected = sorted(a_patient.INFORMATION['Studies'])
+
+    # Without cached main information, the children are listed from the child route
+    assert sorted(i.identifier for i in patient.studies) == expected
+
+    patient._lock_children = True
+    patient.main_dicom_tags  # Caches the main information, which holds the children identifiers
+    assert sorted(i.identifier for i in patient.studies) == expected
+
+
+def test_zip_stream(patient):
+    result = b''.join(patient.get_zip_stream(chunk_size=1024))
+
+    zipfile = ZipFile(io.BytesIO(result))
+    assert zipfile.testzip() is None  # Verify that zip files are valid (if it is, returns None)
+
+    with pytest.raises(httpx.HTTPError):
+        b''.join(Patient('not-existing', patient.client).get_zip_stream())
+
+
 def test_download(patient: Patient, tmp_dir: str):
     buffer = io.BytesIO()
     patient.download(buffer)
@@ -73,6 +113,11 @@ def test_protection(patient):
     assert not patient.protected
 
 
+def test_is_protected_is_deprecated(patient):
+    with pytest.warns(DeprecationWarning):
+        assert not patient.is_protected()
+
+
 def test_anonymize(patient):
     anonymize_patient = patient.anonymize(remove=['PatientName'])
     assert anonymize_patient.patient_id != a_patient.ID
@@ -178,3 +223,16 @@ def test_label(patient, label):
 
     patient.remove_label(label)
     assert label not in patient.labels
+
+
+def test_main_information_cache(patient):
+    patient.name
+    assert patient._information is not None
+
+    # Fields that change over time are not served from the cache
+    patient.client.put_patients_id_labels_label(patient.id_, 'a_label')
+    assert 'a_label' in patient.labels
+
+    patient.refresh()
+    assert patient._information is None
+    assert patient.name == a_patient.NAME
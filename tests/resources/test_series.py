@@ -47,6 +47,33 @@ def test_attributes(series: Series):
             getattr(series, absent_attribute)
 
 
+def test_get_instances_with_prefetch(series):
+    instances = series.get_instances(prefetch=True)
+
+    assert sorted(i.identifier for i in instances) == sorted(a_series.INFORMATION['Instances'])
+    for instance in instances:
+        assert instance._information is not None
+        assert instance.main_dicom_tags == instance.get_main_information()['MainDicomTags']
+
+
+def test_instances_identifiers(series):
+    expected = sorted(a_series.INFORMATION['Instances'])
+
+    # Without cached main information, the children are listed from the child route
+    assert sorted(i.identifier for i in series.instances) == expected
+
+    series._lock_children = True
+    series.main_dicom_tags  # Caches the main information, which holds the children identifiers
+    assert sorted(i.identifier for i in series.instances) == expected
+
+
+def test_zip_stream(series):
+    result = b''.join(series.get_zip_stream(chunk_size=1024))
+
+    zipfile = ZipFile(io.BytesIO(result))
+    assert zipfile.testzip() is None  # Verify that zip files are valid (if it is, returns None)
+
+
 def test_zip(series):
     result = series.get_zip()
 
@@ -50,6 +50,32 @@ def test_remove_empty_series(study: Study):
     assert study.series == []
 
 
+def test_series_identifiers(study):
+    expected = sorted(a_study.INFORMATION['Series'])
+
+    # Without cached main information, the children are listed from the child route
+    assert sorted(i.identifier for i in study.series) == expected
+
+    study._lock_children = True
+    study.main_dicom_tags  # Caches the main information, which holds the children identifiers
+    assert sorted(i.identifier for i in study.series) == expected
+
+
+def test_series_are_not_stale(study):
+    expected = sorted(a_study.INFORMATION['Series'])
+    study.main_dicom_tags  # Caches the main information
+
+    study.client.delete_series_id(expected[0])
+    assert sorted(s.identifier for s in study.series) == expected[1:]
+
+
+def test_zip_stream(study):
+    result = b''.join(study.get_zip_stream(chunk_size=1024))
+
+    zipfile = ZipFile(io.BytesIO(result))
+    assert zipfile.testzip() is None  # Verify that zip files are valid (if it is, returns None)
+
+
 def test_zip(study):
     result = study.get_zip()
 
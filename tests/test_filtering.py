@@ -59,3 +59,19 @@ def test_find(client_fixture, patient_filter, study_filter, series_filter, insta
         instance = series.instances[0]
         assert type(instance) == Instance
         assert instance.uid == an_instance.INFORMATION['MainDicomTags']['SOPInstanceUID']
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_find_with_threads(client_with_data, max_workers):
+    patients = find(
+        orthanc=client_with_data,
+        study_filter=lambda s: s.date == make_datetime_from_dicom_date('20100223'),
+        series_filter=lambda s: s.modality == a_series.MODALITY,
+        instance_filter=lambda i: i.identifier == an_instance.IDENTIFIER,
+        max_workers=max_workers
+    )
+
+    assert [p.identifier for p in patients] == [a_patient.IDENTIFIER]
+    assert [s.identifier for s in patients[0].studies] == [a_study.IDENTIFIER]
+    assert [s.identifier for s in patients[0].studies[0].series] == [a_series.IDENTIFIER]
+    assert [i.identifier for i in patients[0].studies[0].series[0].instances] == [an_instance.IDENTIFIER]
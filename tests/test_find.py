@@ -26,6 +26,7 @@ def test_find_patients(client_with_data_and_labels, query, labels, expected):
 
     for patient in result:
         assert patient.id_ in expected
+        assert patient.main_dicom_tags == a_patient.INFORMATION['MainDicomTags']
 
 
 @pytest.mark.parametrize('query, labels, expected', [